@@ -146,7 +146,7 @@ class ForwardModelBase:
         """Provides a list of all sensor names as an attribute."""
         return self.input_sensor_names + self.output_sensor_names
 
-    def check_sensor_correlation(self) -> list:
+    def check_sensor_correlation(self) -> tuple:
         """
         Checks if all output sensors share the same correlation variables, which is
         a requirement for a valid forward model definition. If this is the case, the
@@ -155,7 +155,7 @@ class ForwardModelBase:
         Returns
         -------
         correlation_variables
-            A list of strings (something like 't') or tuples (something like ('x', 'y'))
+            A tuple of strings (something like 't') or tuples (like ('x', 'y'))
             stating the common correlation variables defined in the forward model's
             output sensors.
         """
@@ -379,7 +379,7 @@ class ForwardModelBase:
     def connect_experimental_data_to_sensors(self, exp_name: str, sensor_values: dict):
         """
         Connects the experimental data from an experiments to the corresponding sensors
-        of the forward model. Note that sensor-objects are essentially dictionaries, so
+        of the forward model. Note that sensor-objects behave like dictionaries, so
         the connection is established by adding the 'exp_name' as key to the respective
         sensor-(dict)-object with the measurements as the dict-values. There are no
         checks in this method because it is only used by InverseProblem.add_experiment
@@ -476,7 +476,7 @@ class ForwardModelBase:
                         "names": [],
                     }
                     for output_sensor in self.output_sensors:
-                        n_i = output_sensor.corr_var_lengths[exp_name][corr_var]
+                        n_i = output_sensor.corr_var_length(exp_name, corr_var)
                         name = output_sensor.name
                         output_lengths[exp_name][corr_var]["increments"].append(n_i)
                         output_lengths[exp_name][corr_var]["names"].append(name)
@@ -883,7 +883,7 @@ class ScalarInterval:
 
     def __str__(self):
         s1 = "[" if self.lower_bound_included else "("
-        s2 = "-oo" if self.lower_bound == -np.infty else self.lower_bound
-        s3 = "+oo" if self.upper_bound == np.infty else self.upper_bound
+        s2 = "-oo" if self.lower_bound == -np.inf else self.lower_bound
+        s3 = "+oo" if self.upper_bound == np.inf else self.upper_bound
         s4 = "]" if self.upper_bound_included else ")"
         return f"{s1}{s2}, {s3}{s4}"
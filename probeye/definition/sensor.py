@@ -1,5 +1,6 @@
 # standard library
-from typing import Union, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Union, List, Tuple, Optional, Iterator
 
 # third party imports
 import numpy as np
@@ -7,22 +8,44 @@ import numpy as np
 # local imports
 from probeye.subroutines import process_spatiotemporal_coordinates
 from probeye.subroutines import len_or_one
+from probeye.subroutines import intern_name
 
+# read-only stand-in for the experiment-dictionary of a sensor that has not been
+# connected to any experimental data yet (see Sensor.experiments); note that it is not
+# stored as an attribute of a sensor, since a MappingProxyType cannot be pickled
+_EMPTY_DICT = MappingProxyType({})  # type: MappingProxyType
 
-class Sensor(dict):
+# the correlation plan (see Sensor._correlation_plan) of an uncorrelated sensor; the
+# only 'correlation variable' is the empty string, the length of which is given by the
+# length of the measurement vector
+_UNCORRELATED_PLAN = (("", None),)
+
+# initial array used for the correlation vector lengths of a sensor (see
+# Sensor._corr_lengths); it is replaced by a larger array on the first insertion
+_NO_LENGTHS = np.empty(0, dtype=np.int64)
+
+# cache for the coordinate orders of the sensors (see Sensor._order); since most sensors
+# share the same few orders (like ('x',) or ('x', 'y', 'z')), they can share the same
+# tuple objects, instead of each sensor holding its own copy
+_ORDER_CACHE = {}  # type: dict
+
+
+class Sensor:
     """
     Base class for an input or output sensor of the forward model. In its simplest form
-    an instance of this class is just a dictionary with a 'name' attribute. Additional
-    attributes for the measured quality (measurand) and the corresponding unit can be
-    defined as well. If the sensors position(s) are important, they can be defined as
-    attributes. Further attributes can be defined by the user by creating new classes
-    derived from this one. If the sensor is used as an output sensor, the parameters
-    that describe the statistics of the error in this sensor must be given. Moreover,
-    a sensor objects points to the experimental data it refers to. For that purpose,
-    the sensor class is derived from the dictionary class (so, essentially, a sensor is
-    a dictionary with additional attributes). The keys of an output sensor are the
-    experiment's names in which some data for this sensor was collected. Consequently,
-    the values are the measured values of the sensor in the respective experiment.
+    an instance of this class is just a dictionary-like object with a 'name' attribute.
+    Additional attributes for the measured quality (measurand) and the corresponding
+    unit can be defined as well. If the sensors position(s) are important, they can be
+    defined as attributes. Further attributes can be defined by the user by creating new
+    classes derived from this one. If the sensor is used as an output sensor, the
+    parameters that describe the statistics of the error in this sensor must be given.
+    Moreover, a sensor objects points to the experimental data it refers to. For that
+    purpose, the sensor class provides a dictionary-like interface (so, essentially, a
+    sensor behaves like a dictionary with additional attributes). The keys of an output
+    sensor are the experiment's names in which some data for this sensor was collected.
+    Consequently, the values are the measured values of the sensor in the respective
+    experiment. Internally, these key-value pairs are stored in the 'experiments'
+    attribute, which is only created when the first experiment is connected.
 
     Parameters
     ----------
@@ -84,14 +107,43 @@ class Sensor(dict):
         corresponds to a constant coordinate, for example the first row might contain
         all values for the x-coordinate of all points. Which row corresponds to which
         coordinate is defined via the order-argument. When 'coords' given, the arguments
-        'x', 'y' and 'z' must be None.
+        'x', 'y' and 'z' must be None. Internally, the coordinates are stored as a
+        contiguous float-array in the 'coords'-attribute. A transposed view of this
+        array (one row per point) is provided by the 'coords_per_point'-attribute.
     order
         Only relevant when 'coords' is given. Defines which row in 'coords' corresponds
         to which coordinate. For example, order=('x', 'y', 'z') means that the 1st row
         of 'coords' contains x-coordinates while the 2nd row contains y-coords and the
         3rd row contains the z-coordinates.
+    coords_dtype
+        The floating point type the coordinates are stored with. The default is
+        numpy.float64. For sensors with very many points, numpy.float32 can be chosen
+        to halve the memory of the coordinates, when single precision is sufficient for
+        the considered problem.
     """
 
+    # a sensor is not derived from dict anymore, so it does not carry the overhead of
+    # a dictionary (and of an instance-__dict__) when it is never connected to data
+    __slots__ = (
+        "name",
+        "measurand",
+        "unit",
+        "coords",
+        "coords_per_point",
+        "_order",
+        "x",
+        "y",
+        "z",
+        "std_model",
+        "std_measurement",
+        "correlated_in",
+        "correlation_variables",
+        "_exp_index",
+        "_corr_lengths",
+        "_corr_plan",
+        "experiments",
+    )
+
     def __init__(
         self,
         name: str,
@@ -105,72 +157,185 @@ class Sensor(dict):
         std_model: str = "not defined",
         std_measurement: str = "not defined",
         correlated_in: Optional[dict] = None,
+        coords_dtype: type = np.float64,
     ):
 
-        # basic attributes
-        self.name = name
-        self.measurand = measurand
-        self.unit = unit
+        # basic attributes; note that the string-attributes of a sensor are interned
+        # here and in the following (check out 'intern_name' for more information)
+        self.name = intern_name(name)
+        self.measurand = intern_name(measurand)
+        self.unit = intern_name(unit)
 
-        # translate possibly given coordinate-information to a coords-array
-        self.coords, self._order = process_spatiotemporal_coordinates(
-            x=x, y=y, z=z, coords=coords, order=order
-        )
+        # the most common case of a point-like sensor with a single scalar coordinate
+        # (for example Sensor('y1', x=0.5)) does not require the general processing of
+        # the coordinate-information done by process_spatiotemporal_coordinates, so the
+        # coords-array is set up directly in this case
+        given_coords = [
+            (v, c) for v, c in (("x", x), ("y", y), ("z", z)) if c is not None
+        ]
+        scalar_coord = None
+        if (
+            coords is None
+            and len(given_coords) == 1
+            and type(given_coords[0][1]) in [float, int]
+            and given_coords[0][0] in order
+        ):
+            scalar_coord = given_coords[0]
+
+        # translate possibly given coordinate-information to a coords-array; the
+        # coordinates are stored as a C-contiguous float-array with one row per
+        # coordinate (e.g., the rows x, y, z); additionally, a transposed view with one
+        # row per point is provided, which requires no copy of the data
+        if scalar_coord is not None:
+            self.coords = np.array(
+                [[scalar_coord[1]]], dtype=coords_dtype
+            )  # type: np.ndarray
+            order_tuple = (scalar_coord[0],)  # type: tuple
+        else:
+            self.coords, order_list = process_spatiotemporal_coordinates(
+                x=x, y=y, z=z, coords=coords, order=order
+            )
+            self.coords = np.ascontiguousarray(self.coords, dtype=coords_dtype)
+            order_tuple = tuple(order_list)
+        self._order = _ORDER_CACHE.setdefault(order_tuple, intern_name(order_tuple))
+        self.coords_per_point = self.coords.T
 
-        # this contains the information which row contains which coordinate
-        self.index_dict = {coord: i for i, coord in enumerate(self._order)}
+        # provide the coordinates as attributes; these are views on the respective rows
+        # of self.coords (so nothing is copied) which are derived only once here, since
+        # they might be accessed very often, e.g. in a forward model's response method;
+        # note that self._order contains at most three elements, so a linear search for
+        # the row indices is cheaper than setting up a dictionary for this purpose
+        self.x, self.y, self.z = (
+            self.coords[self._order.index(v)] if v in self._order else None
+            for v in ("x", "y", "z")
+        )
 
         # these two attributes contain the global names of parameters that describe the
         # model error and the measurement error in this sensor respectively; they will
         # be referred to when evaluating the likelihood function of a likelihood model
-        self.std_model = std_model
-        self.std_measurement = std_measurement
+        self.std_model = intern_name(std_model)
+        self.std_measurement = intern_name(std_measurement)
 
         # attributes directly relating to correlation variables; note that the way of
         # defining both of these attributes guaranties that 'self.correlated_in' is
-        # always a dict (and never None, which is a valid value for 'correlated_in')
-        # and 'self.correlation_variables' is always a list
+        # always a dictionary (and never None, which is a valid value for
+        # 'correlated_in') and 'self.correlation_variables' is always a tuple
         self.correlated_in = {}  # type: dict
-        self.correlation_variables = []
+        self.correlation_variables = ()  # type: tuple
         if correlated_in is not None:
-            self.correlated_in = correlated_in
-            self.correlation_variables = [*self.correlated_in.keys()]
+            self.correlated_in = {
+                intern_name(corr_var): intern_name(corr_prms)
+                for corr_var, corr_prms in correlated_in.items()
+            }
+            self.correlation_variables = tuple(self.correlated_in)
 
-        # this dictionary stores the lengths of the correlation vectors for each
-        # experiment associated with this sensor; if correlation is defined for this
-        # sensor, the keys of 'self.corr_var_lengths' will be experiment names, while
-        # the values will be dictionaries that have correlation variable names as keys
-        # and the corresponding lengths as values
-        self.corr_var_lengths = {}  # type: dict
+        # these two attributes store the lengths of the correlation vectors for each
+        # experiment associated with this sensor; 'self._exp_index' maps the experiment
+        # names to an index, while 'self._corr_lengths' has the (1D) correlation
+        # variable names as keys (the empty string for an uncorrelated sensor) and int-
+        # arrays as values; the length of correlation variable 'x' in experiment 'Exp1'
+        # would be stored in self._corr_lengths['x'][self._exp_index['Exp1']]; note that
+        # the arrays are over-allocated, so they can be longer than the number of exps.;
+        # both dictionaries are only created when the first experiment is connected
+        self._exp_index = None  # type: Optional[dict]
+        self._corr_lengths = None  # type: Optional[dict]
 
-        # required due to inheriting from dict-class
-        super().__init__()
+        # this tuple contains the flattened correlation variables together with their
+        # precomputed lengths (see self._correlation_plan); it defines what is done in
+        # self.__setitem__, so __setitem__ does not have to check which case is given;
+        # for correlated sensors, it is derived only once when the first experiment is
+        # connected, so that attributes set by derived classes after calling this
+        # __init__-method are considered as well
+        self._corr_plan = (
+            None if self.correlated_in else _UNCORRELATED_PLAN
+        )  # type: Optional[tuple]
 
-    @property
-    def x(self) -> Union[np.ndarray, None]:
-        """Provides x-coords as attribute without copying them from coords."""
-        return self.coords[self.index_dict["x"]] if "x" in self._order else None
+        # this dictionary will contain the experiment names as keys and the measured
+        # values as values; it is created only when the first experiment is connected
+        self.experiments = None  # type: Optional[dict]
 
     @property
-    def y(self) -> Union[np.ndarray, None]:
-        """Provides y-coords as attribute without copying them from coords."""
-        return self.coords[self.index_dict["y"]] if "y" in self._order else None
+    def order(self) -> List[str]:
+        """Provides read-access to privat attribute self._order (as a list)."""
+        return list(self._order)
 
     @property
-    def z(self) -> Union[np.ndarray, None]:
-        """Provides z-coords as attribute without copying them from coords."""
-        return self.coords[self.index_dict["z"]] if "z" in self._order else None
+    def corr_var_lengths(self) -> dict:
+        """
+        Provides the lengths of the correlation vectors as a dictionary with experiment
+        names as keys and dictionaries as values, that have the correlation variable
+        names as keys and the corresponding lengths as values. For an uncorrelated
+        sensor, the only correlation variable name is the empty string. For example:
+        {'Exp1': {'x': 3, 't': 10}, 'Exp2': {'x': 3, 't': 12}}.
+        """
+        if self._exp_index is None or self._corr_lengths is None:
+            return {}
+        return {
+            exp_name: {
+                corr_var: int(lengths[idx])
+                for corr_var, lengths in self._corr_lengths.items()
+            }
+            for exp_name, idx in self._exp_index.items()
+        }
 
-    @property
-    def order(self) -> List[str]:
-        """Provides read-access to privat attribute self._order."""
-        return self._order
+    def corr_var_length(self, exp_name: str, corr_var: str = "") -> int:
+        """
+        Returns the length of a correlation vector of a specific experiment without
+        assembling the entire 'corr_var_lengths'-dictionary.
+
+        Parameters
+        ----------
+        exp_name
+            The name of the experiment, for example 'Exp1'.
+        corr_var
+            The 1D correlation variable name, for example 'x' or 't'. For an
+            uncorrelated sensor, this must be the empty string.
+
+        Returns
+        -------
+        n
+            The length of the correlation vector in the given experiment.
+        """
+        if self._exp_index is None or self._corr_lengths is None:
+            raise KeyError(f"Sensor '{self.name}' is not connected to any experiment!")
+        return int(self._corr_lengths[corr_var][self._exp_index[exp_name]])
+
+    def _correlation_plan(self) -> tuple:
+        """
+        Flattens the correlation variables of 'self.correlated_in' and derives the
+        lengths of those correlation variables that are given as attributes of the
+        sensor (for example via the 'x'-argument). Since these lengths do not depend on
+        the experiment, they only need to be computed once.
+
+        Returns
+        -------
+        corr_plan
+            A tuple of (corr_var, coord_len)-pairs, where corr_var is a 1D correlation
+            variable name (like 't' or 'x') and coord_len is its length. In case the
+            correlation variable is not an attribute of the sensor, coord_len is None,
+            which means that the length of the measurement vector has to be used.
+        """
+        corr_plan = []
+        for corr_var_ in self.correlated_in:
+            # note that 'corr_var_' can be just a string (like 't') or a tuple of
+            # strings (like ('x', 'y') in case of a multidimensional spatial var.);
+            # so first, make sure that we have a tuple in each case
+            corr_var_tuple = corr_var_
+            if isinstance(corr_var_, str):
+                corr_var_tuple = (corr_var_,)
+            for corr_var in corr_var_tuple:
+                coord_len = None
+                if hasattr(self, corr_var) and getattr(self, corr_var) is not None:
+                    coord_len = len_or_one(getattr(self, corr_var))
+                corr_plan.append((corr_var, coord_len))
+        return tuple(corr_plan)
 
     def __setitem__(self, key: str, value: Union[int, float, np.ndarray]):
         """
-        Adds a key-value pair to the sensor instance (remember, a sensor is essentially
-        a dictionary with additional attributes). The key is the name of an experiment
-        while the value is a numeric measurement (vector) recorded by this sensor.
+        Adds a key-value pair to the sensor instance (remember, a sensor essentially
+        behaves like a dictionary with additional attributes). The key is the name of an
+        experiment while the value is a numeric measurement (vector) recorded by this
+        sensor.
 
         Parameters
         ----------
@@ -186,29 +351,56 @@ class Sensor(dict):
         exp_name = key
         measurement_vector = value
 
-        if self.correlated_in:
-            for corr_var_ in self.correlated_in:
-                # note that 'corr_var_' can be just a string (like 't') or a tuple of
-                # strings (like ('x', 'y') in case of a multidimensional spatial var.);
-                # so first, make sure that we have a tuple in each case
-                corr_var_tuple = corr_var_
-                if isinstance(corr_var_, str):
-                    corr_var_tuple = (corr_var_,)
-                # now, add the length of each correlation variable defined
-                for corr_var in corr_var_tuple:
-                    if exp_name not in self.corr_var_lengths:
-                        self.corr_var_lengths[exp_name] = {corr_var: 0}
-                    if hasattr(self, corr_var) and getattr(self, corr_var) is not None:
-                        self.corr_var_lengths[exp_name][corr_var] = len_or_one(
-                            getattr(self, corr_var)
-                        )
-                    else:
-                        self.corr_var_lengths[exp_name][corr_var] = len_or_one(
-                            measurement_vector
-                        )
-        else:
-            # in this case, no correlation is defined for the sensor
-            self.corr_var_lengths[exp_name] = {"": len_or_one(measurement_vector)}
+        # for an uncorrelated sensor, the plan was already set in __init__
+        if self._corr_plan is None:
+            self._corr_plan = self._correlation_plan()
+        corr_plan = self._corr_plan
+
+        if self._exp_index is None or self._corr_lengths is None:
+            self._exp_index = {}
+            self._corr_lengths = {}
+
+        # an experiment that is connected again keeps its index
+        idx = self._exp_index.setdefault(exp_name, len(self._exp_index))
+        for corr_var, coord_len in corr_plan:
+            lengths = self._corr_lengths.get(corr_var, _NO_LENGTHS)
+            if idx >= len(lengths):
+                # the capacity is doubled, so that resizing is rarely necessary
+                lengths = np.resize(lengths, max(2 * len(lengths), 4))
+                self._corr_lengths[corr_var] = lengths
+            if coord_len is None:
+                coord_len = len_or_one(measurement_vector)
+            lengths[idx] = coord_len
+
+        # finally, add the key-value-pair to the sensor's experiments
+        if self.experiments is None:
+            self.experiments = {}
+        self.experiments[exp_name] = value
+
+    def __getitem__(self, key: str) -> Union[int, float, np.ndarray]:
+        """Returns the measurement (vector) of the given experiment."""
+        return (self.experiments or _EMPTY_DICT)[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Checks if the sensor was connected to the given experiment."""
+        return key in (self.experiments or _EMPTY_DICT)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the names of the connected experiments."""
+        return iter(self.experiments or _EMPTY_DICT)
+
+    def __len__(self) -> int:
+        """Returns the number of connected experiments."""
+        return len(self.experiments or _EMPTY_DICT)
+
+    def keys(self):
+        """Provides the names of the connected experiments like dict.keys()."""
+        return (self.experiments or _EMPTY_DICT).keys()
+
+    def values(self):
+        """Provides the measurements of the connected experiments like dict.values()."""
+        return (self.experiments or _EMPTY_DICT).values()
 
-        # finally, add the key-value-pair to self
-        super().__setitem__(exp_name, value)
+    def items(self):
+        """Provides the experiment-measurement pairs like dict.items()."""
+        return (self.experiments or _EMPTY_DICT).items()
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 # third party imports
 import numpy as np
+from scipy.linalg import inv
+from scipy.spatial.distance import pdist, squareform
 from tripy.loglikelihood import chol_loglike_1D
 from tripy.loglikelihood import kron_loglike_2D_tridiag
 from tripy.loglikelihood import chol_loglike_2D
@@ -12,6 +14,7 @@ from tripy.utils import inv_cov_vec_1D
 # local imports
 from probeye.definition.likelihood_model import GaussianLikelihoodModel
 from probeye.subroutines import len_or_one, assemble_covariance_matrix
+from probeye.subroutines import HALF_LOG_2PI
 
 # imports only needed for type hints
 if TYPE_CHECKING:  # pragma: no cover
@@ -259,15 +262,11 @@ class CorrelatedModelError(ScipyLikelihoodBase):
             spatial points that are considered.
         """
 
-        # allocate the array for the coordinates
-        n = len(self.get_correlation_vector(correlation_variables[0]))
-        d = len(correlation_variables)
-        coords_array = np.zeros((n, d))
-
-        # fill the prepared array for each spatial dimension-coordinate (in most cases
-        # these correlation-variables will be 'x', 'y' or ''z)
-        for i, correlation_variable in enumerate(correlation_variables):
-            coords_array[:, i] = self.get_correlation_vector(correlation_variable)
+        # stack the correlation vectors of the spatial dimension-coordinates (in most
+        # cases these correlation-variables will be 'x', 'y' or 'z') as columns
+        coords_array = np.column_stack(
+            [self.get_correlation_vector(cv) for cv in correlation_variables]
+        ).astype(np.float64, copy=False)
 
         return coords_array
 
@@ -458,6 +457,10 @@ class CorrelatedModelErrorS23D(CorrelatedModelError1V):
         # these spatial coordinates will be needed for the correlation matrix
         self.coords_array = self.spatial_coordinate_array(self.correlation_variable)
 
+        # for the same reason, the distances between the spatial points can be computed
+        # here once instead of with every assembly of the correlation matrix
+        self.distance_matrix = squareform(pdist(self.coords_array))
+
 
 class CorrelatedModelError2V(CorrelatedModelError):
     """
@@ -650,6 +653,7 @@ class CorrelatedModelError1DS23D(CorrelatedModelError2V):
 
         # set attributes related to the 2D/3D correlation variable
         self.corr_vector_23D = self.spatial_coordinate_array(corr_var_23D)
+        self.distance_matrix_23D = squareform(pdist(self.corr_vector_23D))
         self.l_corr_23D = correlated_in[corr_var_23D]
 
 
@@ -727,18 +731,18 @@ class AdditiveUncorrelatedModelError(UncorrelatedModelError):
             exp_name=self.experiment_name,
             measurement_error=self.additive_measurement_error,
         )
-        variance = np.power(std_model, 2)
+        variance = np.square(std_model)
         n = len(residual_vector)
         if std_meas is not None:
-            variance += np.power(std_meas, 2)
+            variance += np.square(std_meas)
         if stds_are_scalar:
             # in this case, 'variance' is a scalar
-            ll = -n / 2 * np.log(2 * np.pi * variance)
-            ll -= 0.5 / variance * np.sum(np.square(residual_vector))
+            ll = -n * (HALF_LOG_2PI + 0.5 * np.log(variance))
+            ll -= 0.5 / variance * np.dot(residual_vector, residual_vector)
         else:
             # in this case, 'variance' is a  (non-constant) vector
-            ll = -0.5 * (n * np.log(2 * np.pi) + np.sum(np.log(variance)))
-            ll -= 0.5 * np.sum(np.square(residual_vector) / variance)
+            ll = -n * HALF_LOG_2PI - 0.5 * np.sum(np.log(variance))
+            ll -= 0.5 * np.dot(residual_vector, residual_vector / variance)
         return float(ll)
 
 
@@ -903,7 +907,11 @@ class AdditiveCorrelatedModelErrorS23D(CorrelatedModelErrorS23D):
 
         # assemble the covariance matrix
         cov_matrix = assemble_covariance_matrix(
-            self.coords_array, std_model, std_meas, l_corr
+            self.coords_array,
+            std_model,
+            std_meas,
+            l_corr,
+            distance_matrix=self.distance_matrix,
         )
 
         # evaluate log-likelihood (no efficient algorithm available in this case)
@@ -1111,9 +1119,16 @@ class AdditiveCorrelatedModelError1DS23D(CorrelatedModelError1DS23D):
 
         # assemble the covariance matrix and invert it using a small jitter value
         spatial_cov_matrix = assemble_covariance_matrix(
-            self.corr_vector_23D, std_model, std_meas, l_corr_23D
+            self.corr_vector_23D,
+            std_model,
+            std_meas,
+            l_corr_23D,
+            distance_matrix=self.distance_matrix_23D,
+        )
+        spatial_cov_matrix += 1e-6
+        inv_spatial_cov_matrix = inv(
+            spatial_cov_matrix, overwrite_a=True, check_finite=False
         )
-        inv_spatial_cov_matrix = np.linalg.inv(spatial_cov_matrix + 1e-6)
 
         # get the main diagonal and off-diagonal of the time covariance matrix inverse
         d0_t, d1_t = inv_cov_vec_1D(self.corr_vector_1D, l_corr_1D, 1.0)
@@ -1211,16 +1226,15 @@ class MultiplicativeUncorrelatedModelError(UncorrelatedModelError):
         # and can hence be represented by a single vector; this is the case in the
         # computations below, i.e., cov_mtx is a vector; note that both of the following
         # operations work irrespective of std_model/std_meas being scalars or vectors
-        cov_mtx = np.power(response_vector * std_model, 2)
+        cov_mtx = np.square(response_vector * std_model)
         if std_meas is not None:
-            cov_mtx += np.power(std_meas, 2)
+            cov_mtx += np.square(std_meas)
 
         # finally, evaluate the log-likelihood
         n = len_or_one(residual_vector)
-        inv_cov_mtx = 1 / cov_mtx
         log_det_cov_mtx = np.sum(np.log(cov_mtx))
-        ll = -0.5 * (n * np.log(2.0 * np.pi) + log_det_cov_mtx)
-        ll += -0.5 * np.sum(np.power(residual_vector, 2) * inv_cov_mtx)
+        ll = -n * HALF_LOG_2PI - 0.5 * log_det_cov_mtx
+        ll += -0.5 * np.dot(residual_vector, residual_vector / cov_mtx)
         return ll
 
 
@@ -1390,7 +1404,12 @@ class MultiplicativeCorrelatedModelErrorS23D(CorrelatedModelErrorS23D):
 
         # assemble the covariance matrix
         cov_matrix = assemble_covariance_matrix(
-            self.coords_array, std_model, std_meas, l_corr, y_model=response_vector
+            self.coords_array,
+            std_model,
+            std_meas,
+            l_corr,
+            y_model=response_vector,
+            distance_matrix=self.distance_matrix,
         )
 
         # evaluate log-likelihood (no efficient algorithm available in this case)
@@ -1591,9 +1610,16 @@ class MultiplicativeCorrelatedModelError1DS23D(CorrelatedModelError1DS23D):
 
         # assemble the covariance matrix and invert it using a small jitter value
         spatial_cov_matrix = assemble_covariance_matrix(
-            self.corr_vector_23D, std_model, std_meas, l_corr_23D
+            self.corr_vector_23D,
+            std_model,
+            std_meas,
+            l_corr_23D,
+            distance_matrix=self.distance_matrix_23D,
+        )
+        spatial_cov_matrix += 1e-6
+        inv_spatial_cov_matrix = inv(
+            spatial_cov_matrix, overwrite_a=True, check_finite=False
         )
-        inv_spatial_cov_matrix = np.linalg.inv(spatial_cov_matrix + 1e-6)
 
         # get the main diagonal and off-diagonal of the time covariance matrix inverse
         d0_2, d1_2 = inv_cov_vec_1D(self.corr_vector_1D, l_corr_1D, 1.0)
@@ -4,10 +4,12 @@ from typing import Union, List, Optional
 # third party imports
 import numpy as np
 from scipy import stats
+from scipy.special import log_ndtr, xlogy
 
 # local imports
 from probeye.definition.prior import PriorBase
 from probeye.subroutines import len_or_one
+from probeye.subroutines import HALF_LOG_2PI
 
 
 class PriorNormal(PriorBase):
@@ -61,6 +63,15 @@ class PriorNormal(PriorBase):
         """
         mean = prms[f"mean_{self.ref_prm}"]
         std = prms[f"std_{self.ref_prm}"]
+        if method == "logpdf" and use_ref_prm and not kwargs:
+            # this is the call made in each step of a sampling procedure; evaluating
+            # the log-pdf directly avoids the overhead of scipy's generic dispatch; as
+            # in scipy, nan is returned for an invalid standard deviation (std <= 0)
+            valid = std > 0.0
+            std = np.where(valid, std, 1.0)
+            z = (prms[self.ref_prm] - mean) / std
+            logpdf = -0.5 * np.square(z) - np.log(std) - HALF_LOG_2PI
+            return np.where(valid, logpdf, np.nan)[()]
         fun = getattr(stats.norm, method)
         if use_ref_prm:
             x = prms[self.ref_prm]
@@ -219,7 +230,7 @@ class PriorLognormal(PriorBase):
         method: str,
         use_ref_prm: bool = True,
         **kwargs,
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Evaluates stats.lognorm.<method>(x, loc, scale) or, if use_ref_prm=False stats.
         lognorm.<method>(loc, scale). This function is mostly used with method='logpdf'
@@ -243,11 +254,21 @@ class PriorLognormal(PriorBase):
             The result of stats.lognorm.<method>(x, loc, scale) or of stats.lognorm.
             <method>(loc, scale).
         """
+        mu = prms[f"mean_{self.ref_prm}"]
+        sigma = prms[f"std_{self.ref_prm}"]
+        if method == "logpdf" and use_ref_prm and not kwargs:
+            # closed-form log-pdf (see PriorNormal); the support is x > 0
+            x = prms[self.ref_prm]
+            valid = sigma > 0.0
+            sigma = np.where(valid, sigma, 1.0)
+            log_x = np.log(np.where(x > 0.0, x, 1.0))
+            z = (log_x - mu) / sigma
+            logpdf = -0.5 * np.square(z) - log_x - np.log(sigma) - HALF_LOG_2PI
+            logpdf = np.where(x > 0.0, logpdf, -np.inf)
+            return np.where(valid, logpdf, np.nan)[()]
         fun = getattr(stats.lognorm, method)
         # for understanding the following parameter-juggling check out the scipy-docs at
         # https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.lognorm.html
-        mu = prms[f"mean_{self.ref_prm}"]
-        sigma = prms[f"std_{self.ref_prm}"]
         scale = np.exp(mu)
         shape = sigma
         if use_ref_prm:
@@ -319,7 +340,7 @@ class PriorTruncnormal(PriorBase):
         method: str,
         use_ref_prm: bool = True,
         **kwargs,
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Evaluates stats.truncnorm.<method>(x, a, b, loc, scale) or, if use_ref_prm=False
         stats.truncnorm.<method>(a, b, loc, scale). This function is mostly used with
@@ -343,11 +364,23 @@ class PriorTruncnormal(PriorBase):
             The result of stats.truncnorm.<method>(x, loc, scale) or of stats.truncnorm.
             <method>(loc, scale).
         """
-        fun = getattr(stats.truncnorm, method)
         mean = prms[f"mean_{self.ref_prm}"]
         std = prms[f"std_{self.ref_prm}"]
         a = (prms[f"a_{self.ref_prm}"] - mean) / std
         b = (prms[f"b_{self.ref_prm}"] - mean) / std
+        if method == "logpdf" and use_ref_prm and not kwargs:
+            # closed-form log-pdf (see PriorNormal); the log-probability mass of [a, b]
+            # is computed in log-space, so that it does not underflow for intervals far
+            # out in the tails; an interval right of the mode is mirrored to the left
+            # (which does not change its mass), where log_ndtr is accurate
+            z = (prms[self.ref_prm] - mean) / std
+            lo = np.where(a > 0.0, -b, a)
+            hi = np.where(a > 0.0, -a, b)
+            log_hi = log_ndtr(hi)
+            log_mass = log_hi + np.log(-np.expm1(log_ndtr(lo) - log_hi))
+            logpdf = -0.5 * np.square(z) - HALF_LOG_2PI - np.log(std) - log_mass
+            return np.where((z >= a) & (z <= b), logpdf, -np.inf)[()]
+        fun = getattr(stats.truncnorm, method)
         if use_ref_prm:
             x = prms[self.ref_prm]
             return fun(x, a=a, b=b, loc=mean, scale=std, **kwargs)
@@ -412,7 +445,7 @@ class PriorUniform(PriorBase):
 
     def __call__(
         self, prms: dict, method: str, use_ref_prm: bool = True, **kwargs
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Evaluates stats.uniform.<method>(x, loc, scale) or, if use_ref_prm=False stats.
         uniform.<method>(loc, scale). This function is mostly used with method='logpdf'
@@ -436,9 +469,17 @@ class PriorUniform(PriorBase):
             The result of stats.uniform.<method>(x, loc, scale) or of stats.uniform.
             <method>(loc, scale).
         """
-        fun = getattr(stats.uniform, method)
         low = prms[f"low_{self.ref_prm}"]
         high = prms[f"high_{self.ref_prm}"]
+        if method == "logpdf" and use_ref_prm and not kwargs:
+            # closed-form log-pdf (see PriorNormal); the support is [low, high], and an
+            # empty or inverted interval (high <= low) results in nan like in scipy
+            x = prms[self.ref_prm]
+            valid = high > low
+            width = np.where(valid, high - low, 1.0)
+            logpdf = np.where((x >= low) & (x <= high), -np.log(width), -np.inf)
+            return np.where(valid, logpdf, np.nan)[()]
+        fun = getattr(stats.uniform, method)
         if use_ref_prm:
             x = prms[self.ref_prm]
             return fun(x, loc=low, scale=high - low, **kwargs)
@@ -498,7 +539,7 @@ class PriorWeibull(PriorBase):
 
     def __call__(
         self, prms: dict, method: str, use_ref_prm: bool = True, **kwargs
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Evaluates stats.weibull_min.<method>(x, loc, scale) or, if use_ref_prm=False,
         stats.weibull_min.<method>(loc, scale). This function is mostly used with
@@ -522,10 +563,22 @@ class PriorWeibull(PriorBase):
             The result of stats.weibull_min.<method>(x, loc, scale) or of stats.
             weibull_min.<method>(loc, scale).
         """
-        fun = getattr(stats.weibull_min, method)
         shape = prms[f"shape_{self.ref_prm}"]
         loc = prms[f"loc_{self.ref_prm}"]
         scale = prms[f"scale_{self.ref_prm}"]
+        if method == "logpdf" and use_ref_prm and not kwargs:
+            # closed-form log-pdf (see PriorNormal); the support is z >= 0, and xlogy
+            # handles the case z = 0 for shape = 1 like scipy does; as in scipy, nan is
+            # returned for an invalid scale or shape (scale <= 0 or shape <= 0)
+            valid = (scale > 0.0) & (shape > 0.0)
+            scale = np.where(valid, scale, 1.0)
+            shape = np.where(valid, shape, 1.0)
+            z = (prms[self.ref_prm] - loc) / scale
+            z_supp = np.maximum(z, 0.0)
+            logpdf = np.log(shape / scale) + xlogy(shape - 1.0, z_supp) - z_supp**shape
+            logpdf = np.where(z >= 0.0, logpdf, -np.inf)
+            return np.where(valid, logpdf, np.nan)[()]
+        fun = getattr(stats.weibull_min, method)
         if use_ref_prm:
             x = prms[self.ref_prm]
             return fun(x, shape, loc=loc, scale=scale, **kwargs)
@@ -560,6 +613,17 @@ class PriorWeibull(PriorBase):
         )
 
 
+# maps the prior_type of a PriorBase object to the class it is translated to by default
+_PRIOR_CLASSES = {
+    "normal": PriorNormal,
+    "multivariate-normal": PriorMultivariateNormal,
+    "lognormal": PriorLognormal,
+    "truncnormal": PriorTruncnormal,
+    "uniform": PriorUniform,
+    "weibull": PriorWeibull,
+}  # type: dict
+
+
 def translate_prior(
     prior_template: PriorBase, prior_classes: Optional[dict] = None
 ) -> PriorBase:
@@ -593,14 +657,7 @@ def translate_prior(
     # check the prior_classes argument; it either must be None, or of type dict
     if type(prior_classes) is not dict:
         if prior_classes is None:
-            prior_classes = {
-                "normal": PriorNormal,
-                "multivariate-normal": PriorMultivariateNormal,
-                "lognormal": PriorLognormal,
-                "truncnormal": PriorTruncnormal,
-                "uniform": PriorUniform,
-                "weibull": PriorWeibull,
-            }
+            prior_classes = _PRIOR_CLASSES
         else:
             # in this case prior_classes is not None, and not of type dict
             raise TypeError(
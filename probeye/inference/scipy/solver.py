@@ -57,6 +57,19 @@ class ScipySolver:
         for forward_model in self.problem.forward_models.values():
             forward_model.prepare_experimental_inputs_and_outputs()
 
+        # the experimental outputs don't change during the inference, so they are
+        # concatenated to one vector per experiment here once instead of with every
+        # evaluation of the residuals
+        self.exp_response_vectors = {
+            fwd_name: {
+                exp_name: vectorize_numpy_dict(exp_response_dict)
+                for exp_name, exp_response_dict in (
+                    forward_model.output_from_experiments.items()
+                )
+            }
+            for fwd_name, forward_model in self.problem.forward_models.items()
+        }
+
         # translate the prior definitions to objects with computing capabilities
         logger.debug("Translate problem's priors")
         self.priors = copy.deepcopy(self.problem.priors)
@@ -107,8 +120,9 @@ class ScipySolver:
         model_response_vector = vectorize_numpy_dict(model_response_dict)
 
         # compute the residuals by comparing to the experimental response
-        exp_response_dict = forward_model.output_from_experiments[experiment_name]
-        exp_response_vector = vectorize_numpy_dict(exp_response_dict)
+        exp_response_vector = self.exp_response_vectors[forward_model.name][
+            experiment_name
+        ]
         residuals_vector = exp_response_vector - model_response_vector
 
         return model_response_vector, residuals_vector
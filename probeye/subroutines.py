@@ -1,5 +1,6 @@
 # standard library imports
 from copy import copy
+from functools import partial
 from typing import Union, List, Tuple, Any, Optional, Generator, Callable
 from typing import TYPE_CHECKING
 import os
@@ -18,6 +19,10 @@ from probeye import __version__
 if TYPE_CHECKING:  # pragma: no cover
     from probeye.definition.inverse_problem import InverseProblem
 
+# constant term 0.5 * log(2 * pi) of a normal distribution's log-density; it is shared
+# by the closed-form prior log-pdfs and the uncorrelated likelihood models
+HALF_LOG_2PI = float(0.5 * np.log(2.0 * np.pi))
+
 
 def len_or_one(obj: Any) -> int:
     """
@@ -49,6 +54,31 @@ def len_or_one(obj: Any) -> int:
         return 1
 
 
+def intern_name(name: Any) -> Any:
+    """
+    Interns a string (or the strings of a tuple) so that sensors which use the same
+    names (for example coordinate names like 'x' or parameter names like 'sigma') share
+    the same string objects. This saves memory when many sensors are defined, and makes
+    comparisons and dictionary look-ups of these names faster.
+
+    Parameters
+    ----------
+    name
+        A string like 'x' or a tuple of strings like ('x', 'y'). Anything else is
+        returned unchanged.
+
+    Returns
+    -------
+    interned_name
+        The interned version of the given name.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    if type(name) is tuple:
+        return tuple(intern_name(element) for element in name)
+    return name
+
+
 def make_list(arg: Any) -> list:
     """
     Converts a given argument into a list, if it is not a list or tuple. The typical use
@@ -1028,13 +1058,13 @@ def translate_number_string(s: str) -> float:
 
     Returns
     -------
-        Either the number described by the string, or +/- np.infty in the case of an
+        Either the number described by the string, or +/- np.inf in the case of an
         infinity value.
     """
     if s in ["oo", "+oo"]:
-        return np.infty
+        return np.inf
     elif s == "-oo":
-        return -np.infty
+        return -np.inf
     else:
         return float(s)
 
@@ -1082,11 +1112,10 @@ def vectorize_numpy_dict(numpy_dict: dict) -> np.ndarray:
     vector
         Contains the numeric data contained in numpy-dict in a single vector.
     """
-    n_list = []
-    for numpy_vector in numpy_dict.values():
-        n_list.append(np.size(numpy_vector))
-    n = sum(n_list)
-    vector = np.zeros(n)
+    # the vector is allocated without initialization, since each of its entries is
+    # written exactly once by the slice assignments below
+    n_list = [np.size(numpy_vector) for numpy_vector in numpy_dict.values()]
+    vector = np.empty(sum(n_list))
     idx_start = 0
     for numpy_vector, n_i in zip(numpy_dict.values(), n_list):
         idx_end = idx_start + n_i
@@ -1101,6 +1130,7 @@ def assemble_covariance_matrix(
     std_meas: Union[int, float, np.ndarray, None],
     l_corr: Union[int, float],
     y_model: Optional[np.ndarray] = None,
+    distance_matrix: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Assembles and returns the full covariance matrix.
@@ -1120,6 +1150,10 @@ def assemble_covariance_matrix(
     y_model
         The model response. Needed only for multiplicative models. Otherwise None.
         If this value is not None, a multiplicative model is assumed.
+    distance_matrix
+        The (n, n)-array of the euclidean distances between the points in coords_array.
+        Since the coordinates usually don't change between calls, this array can be
+        computed once and passed here. If None, it is derived from coords_array.
 
     Returns
     -------
@@ -1127,20 +1161,31 @@ def assemble_covariance_matrix(
          The full covariance matrix in form of an (n, n)-array.
     """
 
-    # assemble the covariance matrix for additive model error only
-    f_corr = lambda a: correlation_function(d=a, correlation_length=l_corr)
-    std1, std2 = np.meshgrid(std_model, std_model)
-    cov_matrix = std1 * std2 * correlation_matrix(coords_array, f_corr)
+    # assemble the covariance matrix for additive model error only; note that the
+    # correlation function is evaluated only once on the full distance matrix
+    if distance_matrix is not None:
+        corr_matrix = correlation_function(d=distance_matrix, correlation_length=l_corr)
+    else:
+        f_corr = partial(correlation_function, correlation_length=l_corr)
+        corr_matrix = correlation_matrix(coords_array, f_corr)
+    # scale the rows and columns with the standard deviations, i.e., the result is
+    # diag(std_model) * corr_matrix * diag(std_model); this is done by broadcasting
+    # into a single array instead of forming the (n, n)-factors of an outer product
+    std_model = np.atleast_1d(std_model)
+    cov_matrix = corr_matrix * std_model[:, np.newaxis]
+    cov_matrix *= std_model
 
     # adjust the covariance matrix for multiplicative model error
     if y_model is not None:
-        y1, y2 = np.meshgrid(y_model, y_model)
-        cov_matrix = y1 * y2 * cov_matrix
+        y_model = np.atleast_1d(y_model)
+        cov_matrix *= y_model[:, np.newaxis]
+        cov_matrix *= y_model
 
     # adjust the covariance matrix if an additive measurement error is considered
+    # by adding the variance to the main diagonal directly (without forming np.eye(n))
     if std_meas is not None:
-        n = len_or_one(coords_array)
-        cov_matrix += std_meas**2 * np.eye(n)
+        n = cov_matrix.shape[0]
+        cov_matrix.flat[:: n + 1] += np.square(std_meas)
 
     return cov_matrix
 
@@ -126,16 +126,19 @@ class TestProblem(unittest.TestCase):
                         "y3", x=pos_s3, std_model="sigma_3", std_measurement="sigma_m"
                     ),
                 ]
+                # the sensor positions stacked as a column, so that the responses of
+                # all sensors can be evaluated in one broadcasted expression
+                self.xs = np.array(
+                    [os.x for os in self.output_sensors], dtype=np.float64
+                ).reshape(-1, 1)
 
             def response(self, inp: dict) -> dict:
                 t = inp["time"]
                 a = inp["a"]
                 b = inp["b"]
                 const = inp["const"]
-                response = dict()
-                for os in self.output_sensors:
-                    response[os.name] = a * os.x + b * t + const
-                return response
+                ys = a * self.xs + (b * t + const)
+                return {os.name: ys[i] for i, os in enumerate(self.output_sensors)}
 
         # ============================================================================ #
         #                         Define the Inference Problem                         #
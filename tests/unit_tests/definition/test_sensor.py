@@ -1,5 +1,7 @@
 # standard library imports
 import unittest
+import copy
+import pickle
 
 # third party imports
 import numpy as np
@@ -27,8 +29,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.coords.shape, (3, 1))
         self.assertEqual(position_sensor.order, ["x", "y", "z"])
-        for i, value in enumerate([x, y, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, y, z])
 
         # check a position sensor with three coordinates via coords-input
         coords, sensor_name = np.array([[1], [2], [3]]), "Some sensor-name"
@@ -40,8 +41,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.coords.shape, (3, 1))
         self.assertEqual(position_sensor.order, ["x", "y", "z"])
-        for i, value in enumerate([x, y, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, y, z])
 
         # check a position sensor with two coordinates (x and y) via x-y-input
         x, y, sensor_name = 1, 2, "Some sensor-name"
@@ -51,8 +51,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.y, y)
         self.assertEqual(position_sensor.coords.shape, (2, 1))
         self.assertEqual(position_sensor.order, ["x", "y"])
-        for i, value in enumerate([x, y]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, y])
 
         # check a position sensor with two coordinates (x, y) via coords-input
         coords, sensor_name = np.array([[1], [2]]), "Some sensor-name"
@@ -62,8 +61,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.y, y)
         self.assertEqual(position_sensor.order, ["x", "y"])
         self.assertEqual(position_sensor.coords.shape, (2, 1))
-        for i, value in enumerate([x, y]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, y])
 
         # check a position sensor with two coordinates (x and z) via x-z-input
         x, z, sensor_name = 1, 3, "Some sensor-name"
@@ -73,8 +71,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.order, ["x", "z"])
         self.assertEqual(position_sensor.coords.shape, (2, 1))
-        for i, value in enumerate([x, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, z])
 
         # check a position sensor with two coordinates (x, z) via coords-input
         coords, sensor_name = np.array([[1], [3]]), "Some sensor-name"
@@ -84,8 +81,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.order, ["x", "z"])
         self.assertEqual(position_sensor.coords.shape, (2, 1))
-        for i, value in enumerate([x, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [x, z])
 
         # check a position sensor with two coordinates (y and z) via y-z-input
         y, z, sensor_name = 2, 3, "Some sensor-name"
@@ -95,8 +91,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.order, ["y", "z"])
         self.assertEqual(position_sensor.coords.shape, (2, 1))
-        for i, value in enumerate([y, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [y, z])
 
         # check a position sensor with two coordinates (y, z) via coords-input
         coords, sensor_name = np.array([[2], [3]]), "Some sensor-name"
@@ -106,8 +101,7 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.z, z)
         self.assertEqual(position_sensor.order, ["y", "z"])
         self.assertEqual(position_sensor.coords.shape, (2, 1))
-        for i, value in enumerate([y, z]):
-            self.assertAlmostEqual(position_sensor.coords[i], value)
+        np.testing.assert_allclose(position_sensor.coords.ravel(), [y, z])
 
         # check a position sensor with one coordinate (x) via x-input
         x, sensor_name = 1, "Some sensor-name"
@@ -165,6 +159,126 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(position_sensor.coords.shape, (1, 1))
         self.assertAlmostEqual(position_sensor.coords[0], 3)
 
+    def test_sensor_experiment_interface(self):
+        # a sensor that was not connected to any experiments yet
+        sensor = Sensor("y")
+        self.assertIsNone(sensor.experiments)
+        self.assertEqual(len(sensor), 0)
+        self.assertEqual(list(sensor.keys()), [])
+        self.assertFalse("Exp1" in sensor)
+        with self.assertRaises(KeyError):
+            _ = sensor["Exp1"]
+        # now, connect the sensor to two experiments
+        sensor["Exp1"] = np.array([1.0, 2.0])
+        sensor["Exp2"] = 3.0
+        self.assertEqual(len(sensor), 2)
+        self.assertTrue("Exp1" in sensor)
+        self.assertEqual(list(sensor), ["Exp1", "Exp2"])
+        self.assertEqual(list(sensor.keys()), ["Exp1", "Exp2"])
+        self.assertEqual(sensor["Exp2"], 3.0)
+        self.assertEqual(dict(sensor.items())["Exp2"], 3.0)
+        self.assertEqual(len(list(sensor.values())), 2)
+        self.assertFalse(hasattr(sensor, "__dict__"))
+
+    def test_sensor_corr_var_lengths(self):
+        # uncorrelated sensor
+        sensor = Sensor("y", x=1.0)
+        self.assertEqual(sensor.correlated_in, {})
+        self.assertEqual(sensor.corr_var_lengths, {})
+        with self.assertRaises(KeyError):
+            sensor.corr_var_length("Exp1")
+        sensor["Exp1"] = np.array([1.0, 2.0, 3.0])
+        self.assertEqual(sensor.corr_var_lengths, {"Exp1": {"": 3}})
+        # sensor correlated in a coordinate attribute and in a non-attribute variable
+        sensor = Sensor(
+            "y",
+            x=np.array([0.0, 1.0]),
+            y=np.array([2.0, 3.0]),
+            correlated_in={("x", "y"): "l_corr_xy", "t": "l_corr_t"},
+        )
+        sensor["Exp1"] = np.array([1.0, 2.0, 3.0, 4.0])
+        sensor["Exp2"] = 5.0
+        self.assertEqual(
+            sensor.corr_var_lengths,
+            {"Exp1": {"x": 2, "y": 2, "t": 4}, "Exp2": {"x": 2, "y": 2, "t": 1}},
+        )
+        self.assertEqual(sensor.corr_var_length("Exp1", "t"), 4)
+        # connecting an experiment again overwrites its lengths
+        sensor["Exp1"] = np.array([1.0, 2.0])
+        self.assertEqual(sensor.corr_var_length("Exp1", "t"), 2)
+        self.assertEqual(sensor.corr_var_length("Exp2", "t"), 1)
+        # many experiments (requires the internal arrays to grow)
+        for i in range(10):
+            sensor[f"Exp{i}"] = np.ones(i + 1)
+        self.assertEqual(
+            [sensor.corr_var_length(f"Exp{i}", "t") for i in range(10)],
+            list(range(1, 11)),
+        )
+
+    def test_sensor_coords_layout(self):
+        coords = np.array([[1, 2, 3], [4, 5, 6]])
+        sensor = Sensor("y", coords=coords)
+        self.assertEqual(sensor.coords.dtype, np.float64)
+        self.assertTrue(sensor.coords.flags["C_CONTIGUOUS"])
+        self.assertEqual(sensor.coords_per_point.shape, (3, 2))
+        self.assertTrue(np.shares_memory(sensor.coords_per_point, sensor.coords))
+        self.assertTrue(np.allclose(sensor.coords_per_point[1], [2.0, 5.0]))
+        # check the option to store the coordinates in single precision
+        sensor = Sensor("y", coords=coords, coords_dtype=np.float32)
+        self.assertEqual(sensor.coords.dtype, np.float32)
+        self.assertEqual(sensor.x.dtype, np.float32)
+        self.assertEqual(
+            Sensor("y", x=1.0, coords_dtype=np.float32).x.dtype, np.float32
+        )
+
+    def test_sensor_scalar_coord(self):
+        # a single scalar coordinate results in the same attributes as a 1-element array
+        for coord in ["x", "y", "z"]:
+            sensor = Sensor("y1", **{coord: 2})
+            self.assertEqual(getattr(sensor, coord).shape, (1,))
+            self.assertEqual(getattr(sensor, coord), 2.0)
+            self.assertTrue(np.shares_memory(getattr(sensor, coord), sensor.coords))
+            self.assertEqual(sensor.order, [coord])
+            self.assertEqual(sensor.coords.shape, (1, 1))
+            self.assertEqual(sensor.coords.dtype, np.float64)
+            self.assertEqual(sensor.coords_per_point.shape, (1, 1))
+        # the correlation lengths are the same as for a single-element array
+        sensor_1 = Sensor("y1", x=0.5, correlated_in={"x": "l_corr"})
+        sensor_2 = Sensor("y1", x=np.array([0.5]), correlated_in={"x": "l_corr"})
+        sensor_1["Exp1"] = 1.0
+        sensor_2["Exp1"] = 1.0
+        self.assertEqual(sensor_1.corr_var_lengths, sensor_2.corr_var_lengths)
+
+    def test_sensor_copy_and_pickle(self):
+        # uncorrelated and correlated sensors, with and without experimental data
+        sensor_1 = Sensor("y1", x=1.0, y=2.0)
+        sensor_2 = Sensor("y2", x=np.array([0.0, 1.0]), correlated_in={"x": "l_corr"})
+        sensor_2["Exp1"] = np.array([1.0, 2.0])
+        for sensor in [sensor_1, sensor_2]:
+            for sensor_copy in [
+                copy.deepcopy(sensor),
+                pickle.loads(pickle.dumps(sensor)),
+            ]:
+                self.assertEqual(sensor_copy.name, sensor.name)
+                self.assertEqual(sensor_copy.order, sensor.order)
+                np.testing.assert_array_equal(sensor_copy.coords, sensor.coords)
+                np.testing.assert_array_equal(sensor_copy.x, sensor.x)
+                self.assertEqual(sensor_copy.correlated_in, sensor.correlated_in)
+                self.assertEqual(sensor_copy.corr_var_lengths, sensor.corr_var_lengths)
+                self.assertEqual(list(sensor_copy.keys()), list(sensor.keys()))
+        # the copy of an uncorrelated sensor does not share its 'correlated_in'
+        self.assertIsNot(copy.deepcopy(sensor_1).correlated_in, sensor_1.correlated_in)
+
+    def test_sensor_shared_order(self):
+        sensor_1 = Sensor("y1", x=1.0, y=2.0)
+        sensor_2 = Sensor("y2", coords=np.array([[1.0], [2.0]]))
+        self.assertIs(sensor_1._order, sensor_2._order)
+        # changing the returned order of one sensor does not affect the other one
+        order = sensor_1.order
+        order.append("z")
+        self.assertEqual(sensor_1.order, ["x", "y"])
+        self.assertEqual(sensor_2.order, ["x", "y"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -143,7 +143,7 @@ class TestProblem(unittest.TestCase):
 
         # check the likelihood out of a parameter domain
         comp_result = scipy_solver.loglike(theta)
-        self.assertEqual(comp_result, -np.infty)
+        self.assertEqual(comp_result, -np.inf)
 
 
 if __name__ == "__main__":
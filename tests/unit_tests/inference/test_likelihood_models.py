@@ -11,12 +11,17 @@ from probeye.inference.likelihood_models import CorrelatedModelError1V
 
 
 class TestProblem(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # the dummy forward model is not modified by the tests, so it can be shared
+        cls.forward_model = ForwardModelBase(name="_dummy_")
+
     def test_ScipyLikelihoodBase(self):
         # check the base class initialization and loglike-method's NotImplementedError
         scipy_likelihood_base = ScipyLikelihoodBase(
             prms_def={"sigma": "sigma"},
             experiment_name="Exp_1",
-            forward_model=ForwardModelBase(name="_dummy_"),
+            forward_model=self.forward_model,
             additive_measurement_error=False,
             correlation_variables=["x"],
             correlation_model="exp",
@@ -31,7 +36,7 @@ class TestProblem(unittest.TestCase):
             CorrelatedModelError1V(
                 prms_def={"sigma": "sigma"},
                 experiment_name="Exp_1",
-                forward_model=ForwardModelBase(name="_dummy_"),
+                forward_model=self.forward_model,
                 additive_measurement_error=False,
                 correlation_variables=["x", "y"],
                 correlation_model="exp",
@@ -19,19 +19,32 @@ class TestProblem(unittest.TestCase):
     def test_prior_normal(self):
         prior_normal = PriorNormal("a", ["mean_a", "std_a"], "a_normal")
         # check the evaluation of the log-pdf
-        prms = {"a": 1.0, "mean_a": 0.0, "std_a": 1.0}
-        self.assertEqual(
-            stats.norm.logpdf(prms["a"], prms["mean_a"], prms["std_a"]),
-            prior_normal(prms, "logpdf"),
+        for prms in [
+            {"a": 1.0, "mean_a": 0.0, "std_a": 1.0},
+            {"a": -2.5, "mean_a": 1.5, "std_a": 0.3},
+        ]:
+            self.assertAlmostEqual(
+                stats.norm.logpdf(prms["a"], prms["mean_a"], prms["std_a"]),
+                prior_normal(prms, "logpdf"),
+            )
+        # invalid standard deviations result in nan, like in scipy
+        for std in [0.0, -1.0]:
+            invalid_prms = {"a": 1.0, "mean_a": 0.0, "std_a": std}
+            with np.errstate(all="ignore"):
+                sp_logpdf = stats.norm.logpdf(1.0, 0.0, std)
+            np.testing.assert_equal(prior_normal(invalid_prms, "logpdf"), sp_logpdf)
+        # check that other methods are still evaluated via scipy
+        self.assertAlmostEqual(
+            stats.norm.pdf(1.0, 0.0, 1.0),
+            prior_normal({"a": 1.0, "mean_a": 0.0, "std_a": 1.0}, "pdf"),
         )
-        # check the sampling-method (samples are checked one by one)
+        # check the sampling-method (samples must be identical to scipy's)
         prms = {"mean_a": 0.0, "std_a": 1.0}
         prior_samples = prior_normal.generate_samples(prms, 10, seed=1)
         sp_samples = stats.norm.rvs(
             loc=prms["mean_a"], scale=prms["std_a"], size=10, random_state=1
         )
-        for s1, s2 in zip(prior_samples, sp_samples):
-            self.assertEqual(s1, s2)
+        np.testing.assert_array_equal(prior_samples, sp_samples)
         # test multivariate version
         prior_normal = PriorMultivariateNormal("a", ["mean_a", "std_a"], "a_normal")
         prms = {"mean_a": [0.0, 0.0], "cov_a": [1.0, 1.0]}
@@ -46,6 +59,45 @@ class TestProblem(unittest.TestCase):
             "sigma", ["mean_sigma", "std_sigma"], "sigma_normal"
         )
         # check the evaluation of the log-pdf
+        for sigma, mean, std, a, b in [
+            (1.0, 0.0, 1.0, 0.0, 5.0),
+            (-1.0, 0.0, 1.0, 0.0, 5.0),
+            (6.0, 0.0, 1.0, 0.0, 5.0),
+            (0.5, 1.0, 2.0, -3.0, 2.0),
+            (9.0, 0.0, 1.0, 8.0, 10.0),
+            (39.0, 0.0, 1.0, 38.5, 40.0),
+            (41.0, 0.0, 1.0, 40.0, np.inf),
+            (-39.0, 0.0, 1.0, -40.0, -38.5),
+        ]:
+            prms = {
+                "sigma": sigma,
+                "mean_sigma": mean,
+                "std_sigma": std,
+                "a_sigma": a,
+                "b_sigma": b,
+            }
+            self.assertAlmostEqual(
+                stats.truncnorm.logpdf(
+                    prms["sigma"],
+                    a=(prms["a_sigma"] - mean) / std,
+                    b=(prms["b_sigma"] - mean) / std,
+                    loc=prms["mean_sigma"],
+                    scale=prms["std_sigma"],
+                ),
+                prior_truncnormal(prms, "logpdf"),
+            )
+        # the log-pdf must be finite far out in the tails, where the probability mass
+        # of the interval underflows
+        prms = {
+            "sigma": 39.0,
+            "mean_sigma": 0.0,
+            "std_sigma": 1.0,
+            "a_sigma": 38.5,
+            "b_sigma": 40.0,
+        }
+        self.assertAlmostEqual(prior_truncnormal(prms, "logpdf"), -15.72, places=2)
+        prms.update({"sigma": 41.0, "a_sigma": 40.0, "b_sigma": np.inf})
+        self.assertAlmostEqual(prior_truncnormal(prms, "logpdf"), -36.81, places=2)
         prms = {
             "sigma": 1.0,
             "mean_sigma": 0.0,
@@ -53,16 +105,6 @@ class TestProblem(unittest.TestCase):
             "a_sigma": 0.0,
             "b_sigma": 5.0,
         }
-        self.assertEqual(
-            stats.truncnorm.logpdf(
-                prms["sigma"],
-                a=prms["a_sigma"],
-                b=prms["b_sigma"],
-                loc=prms["mean_sigma"],
-                scale=prms["std_sigma"],
-            ),
-            prior_truncnormal(prms, "logpdf"),
-        )
         # check the evaluation of the mean
         mean = prior_truncnormal(prms, method="mean", use_ref_prm=False)
         self.assertAlmostEqual(
@@ -74,7 +116,7 @@ class TestProblem(unittest.TestCase):
                 scale=prms["std_sigma"],
             ),
         )
-        # check the sampling-method (samples are checked one by one)
+        # check the sampling-method (samples must be identical to scipy's)
         prms = {"mean_sigma": 0.0, "std_sigma": 1.0, "a_sigma": 0.0, "b_sigma": 5.0}
         prior_samples = prior_truncnormal.generate_samples(prms, 10, seed=1)
         sp_samples = stats.truncnorm.rvs(
@@ -85,23 +127,31 @@ class TestProblem(unittest.TestCase):
             size=10,
             random_state=1,
         )
-        for s1, s2 in zip(prior_samples, sp_samples):
-            self.assertEqual(s1, s2)
+        np.testing.assert_array_equal(prior_samples, sp_samples)
 
     def test_prior_lognormal(self):
         prior_lognormal = PriorLognormal("a", ["mean_a", "std_a"], "a_lognormal")
         # check the evaluation of the log-pdf
-        prms = {"a": 2.0, "mean_a": 1.0, "std_a": 1.0}
-        self.assertEqual(
-            stats.lognorm.logpdf(
-                prms["a"], scale=np.exp(prms["mean_a"]), s=prms["std_a"]
-            ),
-            prior_lognormal(prms, "logpdf"),
-        )
+        for a in [2.0, 0.3, 0.0, -1.0]:
+            prms = {"a": a, "mean_a": 1.0, "std_a": 1.0}
+            self.assertAlmostEqual(
+                stats.lognorm.logpdf(
+                    prms["a"], scale=np.exp(prms["mean_a"]), s=prms["std_a"]
+                ),
+                prior_lognormal(prms, "logpdf"),
+            )
+            # like scipy, a scalar (and not a 0-d array) is returned for a scalar
+            self.assertNotIsInstance(prior_lognormal(prms, "logpdf"), np.ndarray)
+        # invalid standard deviations result in nan, like in scipy
+        for a, std in [(2.0, 0.0), (2.0, -1.0), (-1.0, 0.0)]:
+            invalid_prms = {"a": a, "mean_a": 1.0, "std_a": std}
+            with np.errstate(all="ignore"):
+                sp_logpdf = stats.lognorm.logpdf(a, scale=np.exp(1.0), s=std)
+            np.testing.assert_equal(prior_lognormal(invalid_prms, "logpdf"), sp_logpdf)
         # check the evaluation of the mean
         mean = prior_lognormal(prms, method="mean", use_ref_prm=False)
         self.assertAlmostEqual(mean, stats.lognorm.mean(s=1.0, scale=np.exp(1.0)))
-        # check the sampling-method (samples are checked one by one)
+        # check the sampling-method (samples must be identical to scipy's)
         prms = {"mean_a": 1.0, "std_a": 1.0}
         prior_samples = prior_lognormal.generate_samples(prms, 10, seed=1)
         sp_samples = stats.lognorm.rvs(
@@ -110,18 +160,28 @@ class TestProblem(unittest.TestCase):
             size=10,
             random_state=1,
         )
-        for s1, s2 in zip(prior_samples, sp_samples):
-            self.assertEqual(s1, s2)
+        np.testing.assert_array_equal(prior_samples, sp_samples)
 
     def test_prior_uniform(self):
         prior_uniform = PriorUniform("a", ["low_a", "high_a"], "a_uniform")
         # check the evaluation of the log-pdf
-        prms = {"a": 0.5, "low_a": 0.0, "high_a": 1.0}
-        self.assertEqual(
-            stats.uniform.logpdf(prms["a"], prms["low_a"], prms["high_a"]),
-            prior_uniform(prms, "logpdf"),
-        )
-        # check the sampling-method (samples are checked one by one)
+        for a in [0.5, 0.0, 2.0, 3.0, -0.1]:
+            prms = {"a": a, "low_a": 0.0, "high_a": 2.0}
+            self.assertAlmostEqual(
+                stats.uniform.logpdf(
+                    prms["a"], prms["low_a"], prms["high_a"] - prms["low_a"]
+                ),
+                prior_uniform(prms, "logpdf"),
+            )
+            # like scipy, a scalar (and not a 0-d array) is returned for a scalar
+            self.assertNotIsInstance(prior_uniform(prms, "logpdf"), np.ndarray)
+        # empty or inverted intervals result in nan, like in scipy
+        for a, low, high in [(1.0, 1.0, 1.0), (1.5, 2.0, 1.0), (3.0, 2.0, 1.0)]:
+            invalid_prms = {"a": a, "low_a": low, "high_a": high}
+            with np.errstate(all="ignore"):
+                sp_logpdf = stats.uniform.logpdf(a, low, high - low)
+            np.testing.assert_equal(prior_uniform(invalid_prms, "logpdf"), sp_logpdf)
+        # check the sampling-method (samples must be identical to scipy's)
         prms = {"low_a": 0.0, "high_a": 1.0}
         prior_samples = prior_uniform.generate_samples(prms, 10, seed=1)
         sp_samples = stats.uniform.rvs(
@@ -130,20 +190,27 @@ class TestProblem(unittest.TestCase):
             size=10,
             random_state=1,
         )
-        for s1, s2 in zip(prior_samples, sp_samples):
-            self.assertEqual(s1, s2)
+        np.testing.assert_array_equal(prior_samples, sp_samples)
 
     def test_prior_weibull(self):
         prior_weibull = PriorWeibull("a", ["loc_a", "scale_a", "shape_a"], "a_weibull")
         # check the evaluation of the log-pdf
-        prms = {"a": 1.0, "loc_a": 1.0, "scale_a": 1.0, "shape_a": 2.0}
-        self.assertEqual(
-            stats.weibull_min.logpdf(
-                prms["a"], prms["shape_a"], prms["loc_a"], prms["scale_a"]
-            ),
-            prior_weibull(prms, "logpdf"),
-        )
-        # check the sampling-method (samples are checked one by one)
+        for a, shape in [(1.0, 2.0), (2.5, 2.0), (1.0, 1.0), (1.7, 0.5), (0.5, 2.0)]:
+            prms = {"a": a, "loc_a": 1.0, "scale_a": 1.5, "shape_a": shape}
+            self.assertAlmostEqual(
+                stats.weibull_min.logpdf(
+                    prms["a"], prms["shape_a"], prms["loc_a"], prms["scale_a"]
+                ),
+                prior_weibull(prms, "logpdf"),
+            )
+            self.assertNotIsInstance(prior_weibull(prms, "logpdf"), np.ndarray)
+        # invalid scales or shapes result in nan, like in scipy
+        for scale, shape in [(0.0, 2.0), (-1.0, 2.0), (1.5, 0.0), (1.5, -1.0)]:
+            invalid_prms = {"a": 2.0, "loc_a": 1.0, "scale_a": scale, "shape_a": shape}
+            with np.errstate(all="ignore"):
+                sp_logpdf = stats.weibull_min.logpdf(2.0, shape, 1.0, scale)
+            np.testing.assert_equal(prior_weibull(invalid_prms, "logpdf"), sp_logpdf)
+        # check the sampling-method (samples must be identical to scipy's)
         prms = {"loc_a": 1.0, "scale_a": 1.0, "shape_a": 2.0}
         prior_samples = prior_weibull.generate_samples(prms, 10, seed=1)
         sp_samples = stats.weibull_min.rvs(
@@ -153,8 +220,7 @@ class TestProblem(unittest.TestCase):
             size=10,
             random_state=1,
         )
-        for s1, s2 in zip(prior_samples, sp_samples):
-            self.assertEqual(s1, s2)
+        np.testing.assert_array_equal(prior_samples, sp_samples)
         # check the evaluation of the mean
         mean = prior_weibull(prms, method="mean", use_ref_prm=False)
         self.assertAlmostEqual(mean, stats.weibull_min.mean(2, loc=1, scale=1))
@@ -10,6 +10,7 @@ import numpy as np
 from probeye.definition.inverse_problem import InverseProblem
 from probeye.subroutines import len_or_one
 from probeye.subroutines import make_list
+from probeye.subroutines import intern_name
 from probeye.subroutines import underlined_string
 from probeye.subroutines import titled_table
 from probeye.subroutines import replace_string_chars
@@ -56,6 +57,19 @@ class TestProblem(unittest.TestCase):
         # but when you do len(np.array(1.0)) you get an error)
         self.assertEqual(len_or_one(np.array(1.0)), 1)
 
+    def test_intern_name(self):
+        # check strings
+        name = "".join(["sig", "ma"])
+        self.assertIs(intern_name(name), intern_name("sigma"))
+        # check tuples of strings
+        names = ("".join(["x", "1"]), "y")
+        self.assertEqual(intern_name(names), ("x1", "y"))
+        self.assertIs(intern_name(names)[0], intern_name("x1"))
+        # anything else is returned unchanged
+        names_list = ["a", "b"]
+        self.assertIs(intern_name(names_list), names_list)
+        self.assertIsNone(intern_name(None))
+
     def test_make_list(self):
         # check main use for single non-list input
         self.assertEqual(make_list("a"), ["a"])
@@ -670,6 +684,19 @@ class TestProblem(unittest.TestCase):
         )
         self.assertTrue(np.allclose(computed_result, expected_result))
 
+        # test with a precomputed distance matrix
+        distance_matrix = np.array(
+            [
+                [0.0, np.sqrt(3.0), np.sqrt(12.0)],
+                [np.sqrt(3.0), 0.0, np.sqrt(3.0)],
+                [np.sqrt(12.0), np.sqrt(3.0), 0.0],
+            ]
+        )
+        computed_result = assemble_covariance_matrix(
+            coords_array_3d, 1, 1, 2, np.array([1.0]), distance_matrix=distance_matrix
+        )
+        self.assertTrue(np.allclose(computed_result, expected_result))
+
 
 if __name__ == "__main__":
     unittest.main()